@@ -7,13 +7,22 @@ CRITICAL: This script must match your Swift Question model EXACTLY
 """
 
 import csv
+import hashlib
 import json
+import random
 import sys
-from collections import Counter, defaultdict
-from typing import List, Dict, Set, Tuple
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Iterable, Iterator, NamedTuple, Optional, Set, Tuple
+
+try:
+    import orjson  # Optional: much faster JSON encoder
+except ImportError:
+    orjson = None
 
 # Valid categories (must match app exactly)
-VALID_CATEGORIES = {
+VALID_CATEGORIES = frozenset({
     'alertness',
     'attitudeToOtherRoadUsers',
     'safetyAndYourVehicle',
@@ -28,146 +37,280 @@ VALID_CATEGORIES = {
     'essentialDocuments',
     'incidents',
     'vehicleLoading'
-}
+})
+
+VALID_DIFFICULTIES = frozenset({'easy', 'medium', 'hard'})
+
+# Correct answer letter -> option index
+ANSWER_MAP = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+# Precomputed for the invalid-category message
+_SORTED_CATEGORIES = ', '.join(sorted(VALID_CATEGORIES))
+
+# CSV columns every question needs (order matches the unpacking in _validate_rows)
+CSV_COLUMNS = (
+    'ID', 'Status', 'Category', 'Difficulty', 'Question',
+    'Option_A', 'Option_B', 'Option_C', 'Option_D',
+    'Correct_Answer', 'Explanation'
+)
+
+# Optional column - when absent every question gets "imageURL": null
+IMAGE_URL_COLUMN = 'Image_URL'
+
+# Read buffer for the CSV (1 MiB) - far fewer read() syscalls than the 8 KiB default
+READ_BUFFER_SIZE = 1 << 20
 
-VALID_DIFFICULTIES = {'easy', 'medium', 'hard'}
+# Validation results are cached here (with --cache), keyed by the CSV's path and contents
+CACHE_DIR = Path('.validate_cache')
 
-class ValidationError:
-    def __init__(self, question_id: str, error: str, severity: str = 'error'):
-        self.question_id = question_id
-        self.error = error
-        self.severity = severity  # 'error', 'warning', 'info'
+# Single RNG for mock test generation - seeded once (see --seed) so runs are reproducible
+MOCK_RNG = random.Random()
+
+class ValidationError(NamedTuple):
+    question_id: str
+    error: str
+    severity: str = 'error'  # 'error', 'warning', 'info'
+    
+    _ICONS = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}
     
     def __str__(self):
-        icon = '❌' if self.severity == 'error' else '⚠️' if self.severity == 'warning' else 'ℹ️'
-        return f"{icon} [{self.question_id}] {self.error}"
+        return f"{self._ICONS[self.severity]} [{self.question_id}] {self.error}"
 
-def validate_questions(csv_file: str) -> tuple[List[Dict], List[ValidationError]]:
-    """Validate CSV and return questions + errors"""
-    questions = []
+def _duplicate_id_error(question_id: str) -> ValidationError:
+    """Error for a Ready row reusing an earlier ID (shared by _quick_scan and _validate_rows)"""
+    return ValidationError(question_id, "Duplicate ID", 'error')
+
+def _invalid_category_error(question_id: str, category: str) -> ValidationError:
+    """Error for a category the app doesn't know (shared by _quick_scan and _validate_rows)"""
+    return ValidationError(
+        question_id,
+        f"Invalid category '{category}'. Must be one of: {_SORTED_CATEGORIES}",
+        'error'
+    )
+
+def _ready_rows(file: Iterable[str], i_status: int, row_width: int) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (row_num, row) for CSV rows that may have Status 'Ready', padded to row_width.
+    
+    A line with no quote characters at the start of a record is a whole record,
+    so its Status is read straight from the raw text and non-Ready rows are
+    skipped before csv splits them into fields. Everything else goes through
+    csv.reader as normal, which re-checks Status."""
+    row_num = 0
+    at_record_start = True
+    
+    def record_lines() -> Iterator[str]:
+        nonlocal row_num, at_record_start
+        for line in file:
+            if at_record_start and '"' not in line:
+                fields = line.split(',', i_status + 1)
+                status = fields[i_status] if len(fields) > i_status else ''
+                # Blank lines are left for csv.reader, which doesn't count them as rows
+                if status.strip() != 'Ready' and line.strip('\r\n'):
+                    row_num += 1
+                    continue
+            at_record_start = False
+            yield line
+    
+    # csv.reader pulls one line at a time, so each row it returns ends a record
+    for row in csv.reader(record_lines()):
+        at_record_start = True
+        # Blank lines are not rows (matches csv.DictReader)
+        if not row:
+            continue
+        row_num += 1
+        
+        # Short rows read as empty trailing fields
+        if len(row) < row_width:
+            row.extend([''] * (row_width - len(row)))
+        
+        yield row_num, row
+
+def _quick_scan(csv_file: str) -> Optional[List[ValidationError]]:
+    """Cheap pre-pass over ID/Category/Status only - returns duplicate ID and
+    invalid category errors, or None if there are none (or the file can't be
+    scanned, which validate_questions reports properly)"""
     errors = []
     seen_ids: Set[str] = set()
-    row_num = 0
     
     try:
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
+        with open(csv_file, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as file:
+            csv_reader = csv.reader(file)
             
-            for row in csv_reader:
-                row_num += 1
-                
-                # Skip if not Ready status
-                if row.get('Status', '').strip() != 'Ready':
+            column_index = {name: i for i, name in enumerate(next(csv_reader, []))}
+            if not {'ID', 'Category', 'Status'} <= column_index.keys():
+                return None
+            i_id, i_category, i_status = column_index['ID'], column_index['Category'], column_index['Status']
+            row_width = max(i_id, i_category, i_status) + 1
+            
+            for _, row in _ready_rows(file, i_status, row_width):
+                if row[i_status].strip() != 'Ready':
                     continue
                 
-                question_id = row.get('ID', '').strip()
-                
-                # Validate ID
+                question_id = row[i_id].strip()
                 if not question_id:
-                    errors.append(ValidationError(f"Row {row_num}", "Missing ID", 'error'))
                     continue
-                
-                # Check for duplicate IDs
                 if question_id in seen_ids:
-                    errors.append(ValidationError(question_id, "Duplicate ID", 'error'))
+                    errors.append(_duplicate_id_error(question_id))
                     continue
                 seen_ids.add(question_id)
                 
-                # Validate category
-                category = row.get('Category', '').strip()
+                category = row[i_category].strip()
                 if category not in VALID_CATEGORIES:
-                    errors.append(ValidationError(
-                        question_id, 
-                        f"Invalid category '{category}'. Must be one of: {', '.join(sorted(VALID_CATEGORIES))}", 
-                        'error'
-                    ))
-                
-                # Validate difficulty
-                difficulty = row.get('Difficulty', '').strip().lower()
-                if difficulty not in VALID_DIFFICULTIES:
-                    errors.append(ValidationError(
-                        question_id,
-                        f"Invalid difficulty '{difficulty}'. Must be: easy, medium, or hard",
-                        'error'
-                    ))
-                
-                # Validate question text
-                question_text = row.get('Question', '').strip()
-                if not question_text:
-                    errors.append(ValidationError(question_id, "Empty question text", 'error'))
-                elif len(question_text) < 10:
-                    errors.append(ValidationError(question_id, "Question text too short (< 10 chars)", 'warning'))
-                elif len(question_text) > 300:
-                    errors.append(ValidationError(question_id, f"Question text too long ({len(question_text)} chars)", 'warning'))
-                
-                # Validate options (must have exactly 4)
-                options = [
-                    row.get('Option_A', '').strip(),
-                    row.get('Option_B', '').strip(),
-                    row.get('Option_C', '').strip(),
-                    row.get('Option_D', '').strip()
-                ]
-                
-                if not all(options):
-                    errors.append(ValidationError(question_id, "Missing one or more options (need exactly 4)", 'error'))
-                
-                # Check for duplicate options
-                if len(set(options)) != len(options):
-                    errors.append(ValidationError(question_id, "Duplicate options detected", 'warning'))
-                
-                # Validate correct answer
-                correct_answer = row.get('Correct_Answer', '').strip().upper()
-                if correct_answer not in ['A', 'B', 'C', 'D']:
-                    errors.append(ValidationError(
-                        question_id,
-                        f"Invalid correct answer '{correct_answer}'. Must be A, B, C, or D",
-                        'error'
-                    ))
-                
-                # Convert correct answer to index
-                answer_map = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
-                correct_index = answer_map.get(correct_answer, 0)
-                
-                # Validate explanation
-                explanation = row.get('Explanation', '').strip()
-                if not explanation:
-                    errors.append(ValidationError(question_id, "Empty explanation", 'error'))
-                elif len(explanation) < 20:
-                    errors.append(ValidationError(question_id, f"Explanation too short ({len(explanation)} chars, minimum 20)", 'warning'))
-                elif len(explanation) > 500:
-                    errors.append(ValidationError(question_id, f"Explanation too long ({len(explanation)} chars, maximum 500)", 'warning'))
-                
-                # Build question object
-                question = {
-                    "id": question_id,
-                    "text": question_text,
-                    "options": options,
-                    "correctAnswer": correct_index,
-                    "explanation": explanation,
-                    "category": category,
-                    "difficulty": difficulty,
-                    "imageURL": row.get('Image_URL', '').strip() or None
-                }
-                
-                questions.append(question)
+                    errors.append(_invalid_category_error(question_id, category))
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+    
+    return errors or None
+
+def _validate_rows(rows: Iterable[Tuple[int, List[str]]], positions: Tuple[int, ...],
+                   i_image_url: Optional[int]) -> Tuple[List[Dict], List[ValidationError]]:
+    """Validate numbered CSV rows and return questions + errors"""
+    questions = []
+    errors = []
+    seen_ids: Set[str] = set()
+    
+    # Pull every field out in one C-level call, then strip them all at once
+    get_fields = itemgetter(*positions)
+    
+    # Local aliases for the hot loop
+    errors_append = errors.append
+    _VError = ValidationError
+    intern = sys.intern
+    
+    for row_num, row in rows:
+        (question_id, status, category, raw_difficulty, question_text,
+         option_a, option_b, option_c, option_d,
+         raw_answer, explanation) = map(str.strip, get_fields(row))
+        
+        # Skip if not Ready status
+        if status != 'Ready':
+            continue
+        
+        # Validate ID
+        if not question_id:
+            errors_append(_VError(f"Row {row_num}", "Missing ID", 'error'))
+            continue
+        
+        # Check for duplicate IDs
+        if question_id in seen_ids:
+            errors_append(_duplicate_id_error(question_id))
+            continue
+        seen_ids.add(question_id)
+        
+        # Validate category (interned - only a handful of distinct values across all questions)
+        category = intern(category)
+        if category not in VALID_CATEGORIES:
+            errors_append(_invalid_category_error(question_id, category))
+        
+        # Validate difficulty
+        difficulty = intern(raw_difficulty.lower())
+        if difficulty not in VALID_DIFFICULTIES:
+            errors_append(_VError(
+                question_id,
+                f"Invalid difficulty '{difficulty}'. Must be: easy, medium, or hard",
+                'error'
+            ))
+        
+        # Validate question text
+        text_len = len(question_text)
+        if not text_len:
+            errors_append(_VError(question_id, "Empty question text", 'error'))
+        elif text_len < 10:
+            errors_append(_VError(question_id, "Question text too short (< 10 chars)", 'warning'))
+        elif text_len > 300:
+            errors_append(_VError(question_id, f"Question text too long ({text_len} chars)", 'warning'))
+        
+        # Validate options (must have exactly 4)
+        options = [option_a, option_b, option_c, option_d]
         
+        if not all(options):
+            errors_append(_VError(question_id, "Missing one or more options (need exactly 4)", 'error'))
+        
+        # Check for duplicate options
+        if len(set(options)) != len(options):
+            errors_append(_VError(question_id, "Duplicate options detected", 'warning'))
+        
+        # Validate correct answer and convert it to an index in one lookup
+        correct_answer = raw_answer.upper()
+        correct_index = ANSWER_MAP.get(correct_answer)
+        if correct_index is None:
+            errors_append(_VError(
+                question_id,
+                f"Invalid correct answer '{correct_answer}'. Must be A, B, C, or D",
+                'error'
+            ))
+            correct_index = 0
+        
+        # Validate explanation
+        explanation_len = len(explanation)
+        if not explanation_len:
+            errors_append(_VError(question_id, "Empty explanation", 'error'))
+        elif explanation_len < 20:
+            errors_append(_VError(question_id, f"Explanation too short ({explanation_len} chars, minimum 20)", 'warning'))
+        elif explanation_len > 500:
+            errors_append(_VError(question_id, f"Explanation too long ({explanation_len} chars, maximum 500)", 'warning'))
+        
+        image_url = row[i_image_url].strip() if i_image_url is not None else ''
+        
+        # Build question object
+        question = {
+            "id": question_id,
+            "text": question_text,
+            "options": options,
+            "correctAnswer": correct_index,
+            "explanation": explanation,
+            "category": category,
+            "difficulty": difficulty,
+            "imageURL": image_url or None
+        }
+        
+        questions.append(question)
+    
+    return questions, errors
+
+def validate_questions(csv_file: str) -> tuple[List[Dict], List[ValidationError]]:
+    """Validate CSV and return questions + errors"""
+    errors = []
+    
+    try:
+        with open(csv_file, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as file:
+            csv_reader = csv.reader(file)
+            
+            # Resolve column positions once from the header instead of hashing per row
+            header = next(csv_reader, [])
+            column_index = {name: i for i, name in enumerate(header)}
+            missing_columns = [c for c in CSV_COLUMNS if c not in column_index]
+            if missing_columns:
+                errors.append(ValidationError("FILE", f"Missing column(s): {', '.join(missing_columns)}", 'error'))
+                return [], errors
+            
+            positions = tuple(column_index[c] for c in CSV_COLUMNS)
+            i_image_url = column_index.get(IMAGE_URL_COLUMN)
+            row_width = max(positions + ((i_image_url,) if i_image_url is not None else ())) + 1
+            rows = _ready_rows(file, positions[1], row_width)
+            
+            return _validate_rows(rows, positions, i_image_url)
+    
     except FileNotFoundError:
         errors.append(ValidationError("FILE", f"CSV file not found: {csv_file}", 'error'))
         return [], errors
     except Exception as e:
         errors.append(ValidationError("FILE", f"Error reading CSV: {str(e)}", 'error'))
         return [], errors
-    
-    return questions, errors
 
-def check_distribution(questions: List[Dict]) -> List[ValidationError]:
+def count_questions(questions: List[Dict]) -> Tuple[Counter, Counter]:
+    """Count questions by category and difficulty in a single pass"""
+    category_counts = Counter()
+    difficulty_counts = Counter()
+    for q in questions:
+        category_counts[q['category']] += 1
+        difficulty_counts[q['difficulty']] += 1
+    return category_counts, difficulty_counts
+
+def check_distribution(questions: List[Dict], category_counts: Counter, difficulty_counts: Counter) -> List[ValidationError]:
     """Check category distribution and balance"""
     errors = []
     
-    # Count by category
-    category_counts = Counter(q['category'] for q in questions)
-    difficulty_counts = Counter(q['difficulty'] for q in questions)
-    
     # Minimum questions per category for mock tests
     min_per_category = 3
     for category in VALID_CATEGORIES:
@@ -194,12 +337,7 @@ def check_distribution(questions: List[Dict]) -> List[ValidationError]:
 
 def generate_balanced_mock_test(questions: List[Dict], num_questions: int = 50) -> List[Dict]:
     """Generate a balanced mock test with proper category distribution"""
-    import random
-    
-    # Group questions by category
-    by_category = defaultdict(list)
-    for q in questions:
-        by_category[q['category']].append(q)
+    rng = MOCK_RNG
     
     # Target distribution (approximate DVSA test)
     target_distribution = {
@@ -219,29 +357,39 @@ def generate_balanced_mock_test(questions: List[Dict], num_questions: int = 50)
         'vehicleLoading': 1
     }
     
-    selected = []
-    
-    # Select questions according to distribution
-    for category, target_count in target_distribution.items():
-        available = by_category.get(category, [])
-        if len(available) >= target_count:
-            selected.extend(random.sample(available, target_count))
+    # Select questions according to distribution: one pass, keeping a reservoir
+    # sample of positions per category (a category short of its target keeps all)
+    reservoirs: Dict[str, List[int]] = {c: [] for c in target_distribution}
+    seen = dict.fromkeys(target_distribution, 0)
+    for i, q in enumerate(questions):
+        category = q['category']
+        reservoir = reservoirs.get(category)
+        if reservoir is None:
+            continue
+        target_count = target_distribution[category]
+        if len(reservoir) < target_count:
+            reservoir.append(i)
         else:
-            # Not enough questions in this category, take all
-            selected.extend(available)
+            j = rng.randint(0, seen[category])
+            if j < target_count:
+                reservoir[j] = i
+        seen[category] += 1
+    
+    # Selection works on a set of integer positions; dicts are only looked up at the end
+    selected: Set[int] = set()
+    for reservoir in reservoirs.values():
+        selected.update(reservoir)
     
     # If we don't have 50 yet, fill with random questions
-    while len(selected) < num_questions and len(selected) < len(questions):
-        remaining = [q for q in questions if q not in selected]
-        if remaining:
-            selected.append(random.choice(remaining))
-        else:
-            break
+    if len(selected) < num_questions:
+        remaining = list(set(range(len(questions))) - selected)
+        deficit = num_questions - len(selected)
+        selected.update(rng.sample(remaining, min(deficit, len(remaining))))
     
-    # Shuffle the final selection
-    random.shuffle(selected)
+    # Permute the selected positions (ints, not dicts) and trim to size
+    order = rng.sample(list(selected), min(num_questions, len(selected)))
     
-    return selected[:num_questions]
+    return [questions[i] for i in order]
 
 def save_json(questions: List[Dict], output_file: str, version: str = "1.0") -> None:
     """Save questions to JSON with versioning"""
@@ -252,35 +400,127 @@ def save_json(questions: List[Dict], output_file: str, version: str = "1.0") ->
         "questions": questions
     }
     
-    with open(output_file, 'w', encoding='utf-8') as file:
-        json.dump(output, file, indent=2, ensure_ascii=False)
+    write_json(output, output_file)
+
+def write_json(data: Dict, output_file: str) -> None:
+    """Write indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(output_file, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # Encode in one go - json.dump issues a write() per token
+        with open(output_file, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(data, indent=2, ensure_ascii=False))
+
+def _cache_prefix(csv_file: str) -> str:
+    """Filename prefix shared by every cache entry for this CSV path"""
+    return hashlib.blake2b(str(Path(csv_file).resolve()).encode('utf-8'), digest_size=8).hexdigest()
+
+def validation_cache_path(csv_file: str) -> Optional[Path]:
+    """Cache file for the current CSV contents (None if the CSV can't be read)"""
+    try:
+        digest = hashlib.blake2b(Path(csv_file).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+    return CACHE_DIR / f"{_cache_prefix(csv_file)}-{digest}.json"
+
+def _is_cached_question(q) -> bool:
+    """True if q has exactly the shape _validate_rows builds for a question"""
+    return (
+        isinstance(q, dict)
+        and q.keys() == {'id', 'text', 'options', 'correctAnswer', 'explanation',
+                         'category', 'difficulty', 'imageURL'}
+        and all(isinstance(q[k], str) for k in ('id', 'text', 'explanation', 'category', 'difficulty'))
+        and isinstance(q['options'], list) and len(q['options']) == 4
+        and all(isinstance(o, str) for o in q['options'])
+        and type(q['correctAnswer']) is int
+        and (q['imageURL'] is None or isinstance(q['imageURL'], str))
+    )
+
+def _is_cached_error(e) -> bool:
+    """True if e is a [question_id, error, severity] list"""
+    return (
+        isinstance(e, list) and len(e) == 3
+        and all(isinstance(f, str) for f in e)
+        and e[2] in ValidationError._ICONS
+    )
+
+def load_cached_validation(cache_path: Path) -> Optional[Tuple[List[Dict], List[ValidationError]]]:
+    """Load cached (questions, errors), ignoring results older than this script.
+    
+    The cache is plain JSON (never pickle), so a planted file can't run code;
+    anything that doesn't have the expected shape is treated as a miss."""
+    try:
+        if cache_path.stat().st_mtime < Path(__file__).stat().st_mtime:
+            return None
+        with open(cache_path, 'rb') as file:
+            cached = (orjson or json).loads(file.read())
+        questions = cached['questions']
+        raw_errors = cached['errors']
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    
+    if not isinstance(questions, list) or not all(map(_is_cached_question, questions)):
+        return None
+    if not isinstance(raw_errors, list) or not all(map(_is_cached_error, raw_errors)):
+        return None
+    return questions, [ValidationError(*e) for e in raw_errors]
 
-def print_report(questions: List[Dict], errors: List[ValidationError]) -> None:
-    """Print validation report"""
+def save_cached_validation(csv_file: str, cache_path: Path,
+                           questions: List[Dict], errors: List[ValidationError]) -> None:
+    """Cache (questions, errors), replacing older entries for the same CSV -
+    best effort, failures are ignored"""
+    cached = {"questions": questions, "errors": [list(e) for e in errors]}
+    if orjson is not None:
+        data = orjson.dumps(cached)
+    else:
+        # Encode in one go - json.dump issues a write() per token
+        data = json.dumps(cached, ensure_ascii=False).encode('utf-8')
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        tmp_path.replace(cache_path)
+        
+        # Results for earlier versions of this CSV can never be hit again
+        for old_path in CACHE_DIR.glob(f"{_cache_prefix(csv_file)}-*.json"):
+            if old_path != cache_path:
+                old_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def print_report(questions: List[Dict], errors: List[ValidationError],
+                 category_counts: Counter, difficulty_counts: Counter) -> int:
+    """Print validation report and return the number of blocking errors"""
     print("\n" + "="*80)
     print("📊 VALIDATION REPORT")
     print("="*80 + "\n")
     
-    # Error summary
-    error_count = sum(1 for e in errors if e.severity == 'error')
-    warning_count = sum(1 for e in errors if e.severity == 'warning')
-    info_count = sum(1 for e in errors if e.severity == 'info')
+    # Bucket by severity in a single pass
+    by_severity = {'error': [], 'warning': [], 'info': []}
+    for e in errors:
+        by_severity[e.severity].append(e)
+    error_count = len(by_severity['error'])
+    warning_count = len(by_severity['warning'])
+    info_count = len(by_severity['info'])
     
     if error_count > 0:
         print(f"❌ ERRORS: {error_count}")
-        for error in [e for e in errors if e.severity == 'error']:
+        for error in by_severity['error']:
             print(f"   {error}")
         print()
     
     if warning_count > 0:
         print(f"⚠️  WARNINGS: {warning_count}")
-        for error in [e for e in errors if e.severity == 'warning']:
+        for error in by_severity['warning']:
             print(f"   {error}")
         print()
     
     if info_count > 0:
         print(f"ℹ️  INFO: {info_count}")
-        for error in [e for e in errors if e.severity == 'info']:
+        for error in by_severity['info']:
             print(f"   {error}")
         print()
     
@@ -290,7 +530,6 @@ def print_report(questions: List[Dict], errors: List[ValidationError]) -> None:
         print(f"   Total questions: {len(questions)}")
         
         # Category breakdown
-        category_counts = Counter(q['category'] for q in questions)
         print(f"\n   By Category:")
         for category in sorted(VALID_CATEGORIES):
             count = category_counts.get(category, 0)
@@ -299,7 +538,6 @@ def print_report(questions: List[Dict], errors: List[ValidationError]) -> None:
             print(f"   {category:30s} {count:3d} ({percentage:5.1f}%) {bar}")
         
         # Difficulty breakdown
-        difficulty_counts = Counter(q['difficulty'] for q in questions)
         print(f"\n   By Difficulty:")
         for diff in ['easy', 'medium', 'hard']:
             count = difficulty_counts.get(diff, 0)
@@ -319,6 +557,8 @@ def print_report(questions: List[Dict], errors: List[ValidationError]) -> None:
     else:
         print("❌ VALIDATION FAILED - Fix errors before converting")
     print("="*80 + "\n")
+    
+    return error_count
 
 def main():
     """Main validation and conversion process"""
@@ -330,6 +570,9 @@ def main():
     parser.add_argument('-v', '--version', default='1.0', help='Questions version number')
     parser.add_argument('--generate-mock', action='store_true', help='Generate sample mock test')
     parser.add_argument('--mock-output', default='mock_test_sample.json', help='Mock test output file')
+    parser.add_argument('--seed', type=int, help='Random seed for a reproducible mock test')
+    parser.add_argument('--cache', action='store_true',
+                        help='Cache validation results in .validate_cache/ and reuse them while the CSV is unchanged')
     
     args = parser.parse_args()
     
@@ -337,21 +580,42 @@ def main():
     print(f"📄 Output: {args.output}")
     print(f"🏷️  Version: {args.version}\n")
     
-    # Validate
-    questions, errors = validate_questions(args.csv_file)
+    # Reuse results from a previous run on the same CSV contents (opt-in: writing
+    # the cache costs about as much as the validation it saves)
+    cache_path = validation_cache_path(args.csv_file) if args.cache else None
+    cached = load_cached_validation(cache_path) if cache_path else None
+    
+    if cached is not None:
+        questions, errors = cached
+        print("♻️  CSV unchanged - using cached validation results\n")
+    else:
+        # Fail fast on structurally broken files before the full validation pass
+        scan_errors = _quick_scan(args.csv_file)
+        if scan_errors:
+            print_report([], scan_errors, Counter(), Counter())
+            print("⛔ Cannot convert - fix errors first\n")
+            sys.exit(1)
+        
+        # Validate
+        questions, errors = validate_questions(args.csv_file)
+        
+        # Only cache a completed parse - FILE errors (unreadable CSV, missing
+        # columns, ...) may be transient and must not stick until the CSV changes
+        if cache_path and not any(e.question_id == "FILE" for e in errors):
+            save_cached_validation(args.csv_file, cache_path, questions, errors)
+    
+    # Count once for the distribution check and the report
+    category_counts, difficulty_counts = count_questions(questions)
     
     # Check distribution
     if questions:
-        dist_errors = check_distribution(questions)
+        dist_errors = check_distribution(questions, category_counts, difficulty_counts)
         errors.extend(dist_errors)
     
-    # Print report
-    print_report(questions, errors)
-    
-    # Check for blocking errors
-    has_errors = any(e.severity == 'error' for e in errors)
+    # Print report (also counts blocking errors)
+    error_count = print_report(questions, errors, category_counts, difficulty_counts)
     
-    if has_errors:
+    if error_count:
         print("⛔ Cannot convert - fix errors first\n")
         sys.exit(1)
     
@@ -362,13 +626,14 @@ def main():
         
         # Generate mock test if requested
         if args.generate_mock:
+            if args.seed is not None:
+                MOCK_RNG.seed(args.seed)
             mock_test = generate_balanced_mock_test(questions)
-            with open(args.mock_output, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "mockTest": mock_test,
-                    "totalQuestions": len(mock_test),
-                    "categoryDistribution": dict(Counter(q['category'] for q in mock_test))
-                }, f, indent=2, ensure_ascii=False)
+            write_json({
+                "mockTest": mock_test,
+                "totalQuestions": len(mock_test),
+                "categoryDistribution": dict(Counter(q['category'] for q in mock_test))
+            }, args.mock_output)
             print(f"✅ Generated balanced mock test: {args.mock_output}\n")
     
     sys.exit(0)